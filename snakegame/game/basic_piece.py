@@ -32,6 +32,25 @@ class BasicPiece:
     """Wait time to close (milliseconds).
     """
 
+    IGNORED_EVENTS = [
+        pygame.MOUSEMOTION,
+        pygame.MOUSEBUTTONDOWN,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.FINGERMOTION,
+        pygame.FINGERDOWN,
+        pygame.FINGERUP,
+        pygame.JOYAXISMOTION,
+        pygame.JOYBALLMOTION,
+        pygame.JOYHATMOTION,
+        pygame.JOYBUTTONDOWN,
+        pygame.JOYBUTTONUP,
+        pygame.TEXTINPUT,
+        pygame.TEXTEDITING
+    ]
+    """Event types the game never handles. They are blocked so they are not queued.
+    """
+
     def __init__(
         self,
         window_manager: WindowManager,
@@ -60,6 +79,7 @@ class BasicPiece:
         self.__window_manager = window_manager
         self.__clock = clock
         self.__fps = validation.is_positive(fps, "'fps' cannot be less than 1!")
+        pygame.event.set_blocked(BasicPiece.IGNORED_EVENTS)
 
     def set_game_state(self, game_state: GameState) -> None:
         """
@@ -67,16 +67,16 @@ class Game:
         while True:
             game_state = self.__basic_piece.get_game_state()
 
-            if game_state == GameState.MENU:
+            if game_state is GameState.MENU:
                 self.__menu.start()
-            elif game_state == GameState.PAUSE:
+            elif game_state is GameState.PAUSE:
                 self.__menu.start_pause_menu()
-            elif game_state == GameState.TIMER:
+            elif game_state is GameState.TIMER:
                 self.__draw()
                 self.__timer.start()
-            elif game_state == GameState.LOADING:
+            elif game_state is GameState.LOADING:
                 self.__loading.start()
-            elif game_state == GameState.GAME:
+            elif game_state is GameState.GAME:
                 self.__events()
                 self.__draw()
                 self.__update()
@@ -15,6 +15,8 @@ class WindowManager:
         The RGB color tuple used to fill the game's display window.
     __applied_blur : bool
         Indicates whether blur has already been applied to a screenshot.
+    __window_center : tuple[int, int]
+        The coordinate of the window's center.
     """
 
     def __init__(
@@ -40,6 +42,7 @@ class WindowManager:
         self.__window = window
         self.__color = validation.is_valid_rgb(color, "'color' out of RGB range!")
         self.__applied_blur = False
+        self.__window_center = self.__window.get_width() // 2, self.__window.get_height() // 2
 
     def get_window(self) -> Surface:
         """
@@ -56,7 +59,7 @@ class WindowManager:
         """
         Returns the coordinate of the window's center.
         """
-        return self.__window.get_width() // 2, self.__window.get_height() // 2
+        return self.__window_center
 
     @staticmethod
     def update_window() -> None:
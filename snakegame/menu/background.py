@@ -1,3 +1,5 @@
+from typing import Callable
+
 import pygame
 from pygame import Surface, Rect, SurfaceType
 from pygame.event import Event
@@ -26,12 +28,22 @@ class Background:
         The background color.
     __images : list[Surface | SurfaceType]
         Background image list.
+    __image_amount : int
+        The number of background images.
     __image_event : int
         The ID of the pygame event that triggers the image change.
     __current_image : int
         The index of the current image being used.
     __background : str
         The background image.
+    __draw_background : Callable[[Surface], None]
+        Draws the background and title, either as a filled rectangle or as the
+        current image. Chosen whenever the image list changes.
+    __title_margin : int
+        The distance between the title and the background edge.
+    __align_title : Callable[[], None]
+        Places the title according to the title alignment. Chosen once, since
+        the alignment never changes.
     """
 
     TITLE_MARGIN_PERCENTAGE = 0.04
@@ -86,9 +98,13 @@ class Background:
         self.__color = validation.is_valid_rgb(color, "'background_color' out of RGB range!")
         self.__image_paths = validation.check_paths(image_paths, "'background_image_path' not found!", True)
         self.__images = self.__load_images()
+        self.__image_amount = len(self.__images)
         self.__image_event = image_event
         self.__current_image = 0
         self.__background: Rect | tuple[Surface | SurfaceType, Rect | RectType] = self.__configure_background()
+        self.__draw_background = self.__configure_draw()
+        self.__title_margin = int(self.get_height() * Background.TITLE_MARGIN_PERCENTAGE)
+        self.__align_title = self.__configure_title_alignment()
         self.__align_title()
 
     def events(self, event: Event) -> None:
@@ -113,7 +129,6 @@ class Background:
             The window where the background will be drawn.
         """
         self.__draw_background(window)
-        self.__title.draw(window)
 
     def set_center(self, center: tuple[int, int]) -> None:
         """
@@ -204,7 +219,9 @@ class Background:
             The list of images.
         """
         self.__images = images
+        self.__image_amount = len(images)
         self.__background = self.__configure_background()
+        self.__draw_background = self.__configure_draw()
 
     def reset_image_loop(self) -> None:
         """Resets the background image loop so that whenever it starts, it starts from the first image."""
@@ -212,9 +229,10 @@ class Background:
         self.__background = self.__configure_background()
 
     def __load_images(self) -> list | list[tuple[Surface | SurfaceType, Rect | RectType]]:
+        rect = Rect((0, 0), self.__dimensions)
         images = []
         for image in util.load_images(self.__image_paths, self.__dimensions):
-            images.append((image, image.get_rect()))
+            images.append((image, rect))
 
         return images
 
@@ -226,24 +244,35 @@ class Background:
 
         return background
 
-    def __draw_background(self, window: Surface) -> None:
-        if type(self.__background) is Rect:
-            pygame.draw.rect(window, self.__color, self.__background)
+    def __configure_draw(self) -> Callable[[Surface], None]:
+        if self.__images:
+            draw = self.__draw_image
         else:
-            image, rect = self.__background
-            window.blit(image, rect)
+            draw = self.__draw_color
+
+        return draw
+
+    def __draw_color(self, window: Surface) -> None:
+        pygame.draw.rect(window, self.__color, self.__background)
+        window.blit(self.__title.get_text(), self.__title.get_rect())
 
-    def __align_title(self) -> None:
+    def __draw_image(self, window: Surface) -> None:
+        title = self.__title.get_text(), self.__title.get_rect()
+        window.blits((self.__background, title), doreturn=False)
+
+    def __configure_title_alignment(self) -> Callable[[], None]:
         if self.__text_alignment == 1:
-            self.__align_title_to_top()
+            align_title = self.__align_title_to_top
         elif self.__text_alignment == 2:
-            self.__align_title_to_center()
+            align_title = self.__align_title_to_center
         else:
-            self.__align_title_to_bottom()
+            align_title = self.__align_title_to_bottom
+
+        return align_title
 
     def __align_title_to_top(self) -> None:
         midtop_x, midtop_y = self.get_midtop()
-        midtop = midtop_x, midtop_y + self.__calculate_title_margin()
+        midtop = midtop_x, midtop_y + self.__title_margin
         self.__title.set_midtop(midtop)
 
     def __align_title_to_center(self) -> None:
@@ -251,22 +280,16 @@ class Background:
 
     def __align_title_to_bottom(self) -> None:
         midbottom_x, midbottom_y = self.get_midbottom()
-        midbottom = midbottom_x, midbottom_y - self.__calculate_title_margin()
+        midbottom = midbottom_x, midbottom_y - self.__title_margin
         self.__title.set_midbottom(midbottom)
 
-    def __calculate_title_margin(self) -> int:
-        return int(self.get_height() * Background.TITLE_MARGIN_PERCENTAGE)
-
     def __change_background(self, event: Event) -> None:
-        if type(self.__background) is not Rect and event.type == self.__image_event:
+        if self.__image_amount and event.type == self.__image_event:
             self.__change_current_image()
             self.__background = self.__images[self.__current_image]
 
     def __change_current_image(self) -> None:
-        if self.__current_image < len(self.__images) - 1:
-            self.__current_image += 1
-        else:
-            self.__current_image = 0
+        self.__current_image = (self.__current_image + 1) % self.__image_amount
 
     @staticmethod
     def __check_title_alignment(title_alignment: int) -> int:
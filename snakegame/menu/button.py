@@ -1,5 +1,5 @@
 import pygame.draw
-from pygame import Rect, Surface
+from pygame import Rect, Surface, SRCALPHA
 from pygame.rect import RectType
 
 from snakegame.animation.click import Click
@@ -10,6 +10,19 @@ from snakegame import validation
 from snakegame.text.text import Text
 
 
+_BODY_ATLAS: dict[tuple[int, int, tuple[int, int, int], int], Surface] = {}
+"""The rasterized button bodies, indexed by width, height, color and border radius.
+"""
+
+_BORDER_ATLAS: dict[tuple[int, int, tuple[int, int, int], int, int], Surface] = {}
+"""The rasterized button borders, indexed by width, height, color, border radius and thickness.
+"""
+
+_LABEL_ATLAS: dict[tuple[str, int, tuple[int, int, int], str], Surface] = {}
+"""The rendered button labels, indexed by option name, text size, color and font path.
+"""
+
+
 class Button:
     """
     A class for creating and drawing a button on the window.
@@ -28,6 +41,8 @@ class Button:
         The secondary RGB color of the button.
     __accent_color : tuple[int, int, int]
         the accent RGB color of the button.
+    __current_accent_color : tuple[int, int, int]
+        The accent RGB color currently in use (accent or secondary color).
     __coordinate : tuple[int, int]
         The coordinate of the top-left corner of the button.
     __text : Text
@@ -46,6 +61,24 @@ class Button:
         The thickness of the button border.
     """
 
+    __slots__ = (
+        "__option",
+        "__sound_manager",
+        "__size",
+        "__main_color",
+        "__secondary_color",
+        "__accent_color",
+        "__current_accent_color",
+        "__coordinate",
+        "__text",
+        "__top_shape",
+        "__bottom_shape",
+        "__border_shape",
+        "__click_animation",
+        "__border_radius",
+        "__edge_thickness"
+    )
+
     TEXT_SIZE_PERCENTAGE = 0.5
     """The percentage of the button text size.
     """
@@ -183,20 +216,26 @@ class Button:
         window : Surface
             The window where the button will be drawn.
         """
-        pygame.draw.rect(
-            window, self.__main_color, self.__bottom_shape,
-            border_radius=self.__border_radius
-        )
-        pygame.draw.rect(
-            window, self.__main_color, self.__top_shape,
-            border_radius=self.__border_radius
-        )
-        pygame.draw.rect(
-            window, self.__current_accent_color, self.__top_shape,
-            self.__edge_thickness, self.__border_radius
-        )
+        window.blits(self.get_blit_sequence(), doreturn=False)
+
+    def get_blit_sequence(self) -> list[tuple[Surface, Rect | RectType]]:
+        """
+        Returns the surfaces that make up the button, each paired with the
+        rect where it is drawn, in drawing order.
+
+        Returns
+        -------
+        list[tuple[Surface, Rect | RectType]]
+            The (surface, rect) pairs, ready for Surface.blits.
+        """
+        body = self.__get_body()
 
-        self.__draw_text(window)
+        return [
+            (body, self.__bottom_shape),
+            (body, self.__top_shape),
+            (self.__get_border(), self.__top_shape),
+            (self.__get_label(), self.__text.get_rect())
+        ]
 
     def events(self, selector_coordinate: tuple[int, int], is_clicking: bool) -> ButtonOption:
         """
@@ -216,7 +255,7 @@ class Button:
             or the ButtonOption.NONE option otherwise.
         """
         result = self.the_selector_is_next_to_the_button(selector_coordinate[1])
-        self.__enable_accent_color(result)
+        self.enable_accent_color(result)
         return self.__manage_click(result, is_clicking)
 
     def set_center(self, center: tuple[int, int]) -> None:
@@ -243,6 +282,17 @@ class Button:
         self.__top_shape.midtop = midtop
         self.set_coordinate((self.__top_shape.x, self.__top_shape.y))
 
+    def get_top_shape_midtop(self) -> tuple[int, int]:
+        """
+        Returns the center coordinates of the top edge of the top shape
+
+        Returns
+        -------
+        tuple[int, int]
+            The midtop-coordinate.
+        """
+        return self.__top_shape.midtop
+
     def get_bottom_shape_midleft(self) -> tuple[int, int]:
         """
         Returns the center coordinates of the left edge of the bottom shape
@@ -281,15 +331,60 @@ class Button:
         """
         return self.__top_shape.topleft[1]<selector_coordinate_y< self.__top_shape.bottomleft[1]
 
-    def __enable_accent_color(self, wish: bool) -> None:
+    def enable_accent_color(self, wish: bool) -> None:
+        """
+        Switches between the accent color and the secondary color of the button.
+
+        Parameters
+        ----------
+        wish : bool
+            True to use the accent color, False to use the secondary color.
+        """
         if wish:
             self.__current_accent_color = self.__accent_color
         else:
             self.__current_accent_color = self.__secondary_color
 
-    def __draw_text(self, window: Surface) -> None:
-        self.__text.set_color(self.__current_accent_color)
-        self.__text.draw(window)
+    def __get_body(self) -> Surface:
+        width, height = self.__top_shape.size
+        key = (width, height, self.__main_color, self.__border_radius)
+        body = _BODY_ATLAS.get(key)
+
+        if body is None:
+            body = Surface((width, height), SRCALPHA)
+            pygame.draw.rect(
+                body, self.__main_color, body.get_rect(),
+                border_radius=self.__border_radius
+            )
+            _BODY_ATLAS[key] = body
+
+        return body
+
+    def __get_border(self) -> Surface:
+        width, height = self.__top_shape.size
+        key = (width, height, self.__current_accent_color, self.__border_radius, self.__edge_thickness)
+        border = _BORDER_ATLAS.get(key)
+
+        if border is None:
+            border = Surface((width, height), SRCALPHA)
+            pygame.draw.rect(
+                border, self.__current_accent_color, border.get_rect(),
+                self.__edge_thickness, self.__border_radius
+            )
+            _BORDER_ATLAS[key] = border
+
+        return border
+
+    def __get_label(self) -> Surface:
+        key = (self.__option.name, self.__text.get_size(), self.__current_accent_color, self.__text.get_font_path())
+        label = _LABEL_ATLAS.get(key)
+
+        if label is None:
+            self.__text.set_color(self.__current_accent_color)
+            label = self.__text.get_text()
+            _LABEL_ATLAS[key] = label
+
+        return label
 
     def __configure_top_background(self) -> Rect | RectType:
         width = self.__text.get_width() + self.__size*Button.WIDTH_FACTOR
@@ -298,9 +393,10 @@ class Button:
         return Rect(self.__coordinate, (width, height))
 
     def __configure_text(self, font_path: str) -> Text:
-        size = int(self.__size * Button.TEXT_SIZE_PERCENTAGE)
+        return Text(self.__option.name, self.__calculate_text_size(), self.__secondary_color, font_path)
 
-        return Text(self.__option.name, size, self.__secondary_color, font_path)
+    def __calculate_text_size(self) -> int:
+        return int(self.__size * Button.TEXT_SIZE_PERCENTAGE)
 
     def __configure_animation(self) -> Click:
         return Click(
@@ -321,7 +417,10 @@ class Button:
         self.__border_shape = self.__top_shape.copy()
 
     def __reload_text(self) -> None:
-        self.__text = self.__configure_text(self.__text.get_font_path())
+        size = self.__calculate_text_size()
+
+        if size != self.__text.get_size():
+            self.__text.set_size(size)
 
     def __reload_animation(self) -> None:
         self.__click_animation.reload_click(
@@ -29,16 +29,13 @@ class ConfirmationMenu(Menu):
             3 - bottom alignment.
     """
 
+    __slots__ = ()
+
     def __init__(
             self,
             basic_piece: BasicPiece,
             sound_manager: SoundManager,
-            background: Background = Background(
-                AnimatedText(constants.CONFIRMATION_MENU_TITLE),
-                dimensions=constants.CONFIRMATION_MENU_DIMENSIONS,
-                color=constants.GREEN_1,
-                image_paths=constants.CONFIRMATION_MENU_IMAGES
-            ),
+            background: Background | None = None,
             button_alignment: int = constants.BOTTOM_ALIGNMENT
     ):
         """
@@ -51,7 +48,12 @@ class ConfirmationMenu(Menu):
         sound_manager : SoundManager
             The sound manager of the game.
         background : Background, optional
-            The pause menu background (default is BACKGROUND).
+            The confirmation menu background (default is None, which creates Background(
+                AnimatedText(constants.CONFIRMATION_MENU_TITLE),
+                dimensions=constants.CONFIRMATION_MENU_DIMENSIONS,
+                color=constants.GREEN_1,
+                image_paths=constants.CONFIRMATION_MENU_IMAGES
+            )).
         button_alignment : {1, 2, 3}, optional
             Represents is the alignment of the buttons (default is constants.PAUSE_MENU_BUTTON_ALIGNMENT):
                 1 - top alignment;
@@ -63,19 +65,26 @@ class ConfirmationMenu(Menu):
         ValueError
             If the 'button_alignment' value is not in the range (1-3).
         """
+        if background is None:
+            background = Background(
+                AnimatedText(constants.CONFIRMATION_MENU_TITLE),
+                dimensions=constants.CONFIRMATION_MENU_DIMENSIONS,
+                color=constants.GREEN_1,
+                image_paths=constants.CONFIRMATION_MENU_IMAGES
+            )
+
         background.set_center(basic_piece.get_window_manager().get_window_center())
         super().__init__(basic_piece, sound_manager, background, button_alignment)
 
     def run_another_action(self, selected_option: ButtonOption) -> None:
-        if selected_option == ButtonOption.YES:
-            super().quit()
-        elif selected_option == ButtonOption.NO:
+        if selected_option in (ButtonOption.YES, ButtonOption.NO):
             super().quit()
 
     def create_buttons(self) -> list[Button]:
+        sound_manager = super().get_sound_manager()
         buttons = [
-            Button(ButtonOption.YES, super().get_sound_manager()),
-            Button(ButtonOption.NO, super().get_sound_manager())
+            Button(ButtonOption.YES, sound_manager),
+            Button(ButtonOption.NO, sound_manager)
         ]
         return buttons
 
@@ -83,7 +92,7 @@ class ConfirmationMenu(Menu):
         pass
 
     def drawings_below(self, window: Surface) -> None:
-        super().get_basic_piece().get_window_manager().apply_blur()
+        self.get_basic_piece().get_window_manager().apply_blur()
 
     def drawings_above(self, window: Surface) -> None:
         pass
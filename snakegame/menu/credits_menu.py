@@ -32,15 +32,15 @@ class CreditsMenu(Menu):
         The credits that will be displayed.
     """
 
+    __slots__ = ("__credits",)
+
     def __init__(
             self,
             basic_piece: BasicPiece,
             sound_manager: SoundManager,
-            background: Background = Background(
-                AnimatedText(constants.CREDITS_MENU_TITLE)
-            ),
+            background: Background | None = None,
             button_alignment: int = constants.BOTTOM_ALIGNMENT,
-            credits: Text = Text(constants.CREDITS, constants.CREDITS_SIZE)
+            credits: Text | None = None
     ):
         """
         Initialize the CreditsMenu.
@@ -52,25 +52,34 @@ class CreditsMenu(Menu):
         sound_manager : SoundManager
             The sound manager of the game.
         background : Background, optional
-            The credits menu background (default is Background(AnimatedText(constants.CREDITS_MENU_TITLE))).
+            The credits menu background
+            (default is None, which creates Background(AnimatedText(constants.CREDITS_MENU_TITLE))).
         button_alignment : {1, 2, 3}, optional
             Represents is the alignment of the buttons (default is constants.CREDITS_MENU_BUTTON_ALIGNMENT):
                 1 - top alignment;
                 2 - center alignment;
                 3 - bottom alignment.
         credits : Text, optional
-            The credits that will be displayed (default is Text(constants.CREDITS, constants.CREDITS_SIZE)).
+            The credits that will be displayed (default is None, which creates
+            Text(constants.CREDITS, constants.CREDITS_SIZE) in __init__).
 
         Raises
         ------
         ValueError
             If the 'button_alignment' value is not in the range (1-3).
         """
+        if background is None:
+            background = Background(AnimatedText(constants.CREDITS_MENU_TITLE))
+
         super().__init__(basic_piece, sound_manager, background, button_alignment)
+
+        if credits is None:
+            credits = Text(constants.CREDITS, constants.CREDITS_SIZE)
+
         self.__credits = self.__align_credits(credits)
 
     def run_another_action(self, selected_option: ButtonOption) -> None:
-        if selected_option == ButtonOption.BACK:
+        if selected_option is ButtonOption.BACK:
             super().quit()
 
     def create_buttons(self) -> list[Button]:
@@ -92,7 +101,7 @@ class CreditsMenu(Menu):
         pass
 
     def __align_credits(self, credits: Text) -> Text:
-        center = super().get_background().get_center()
+        center = self.get_background().get_center()
         credits.set_center(center)
 
         return credits
@@ -27,18 +27,15 @@ class Loading:
         The height and width of the loading screen.
     __image_path_lists : list[list[str]]
         the image path lists.
-    __image_lists : list | list[list[tuple[Surface | SurfaceType, Rect | RectType]]]
-        The image lists.
-    __start_time : int
-        The time in seconds that the loading screen started.
+    __image_lists : list[list[tuple[Surface | SurfaceType, Rect | RectType]] | None]
+        The image lists. Each list is only loaded the first time it is chosen.
+    __deadline : float
+        The monotonic time, in seconds, at which the loading screen ends.
     """
     def __init__(
             self,
             basic_piece: BasicPiece,
-            background: Background = Background(
-                AnimatedText(constants.LOADING_TITLE),
-                constants.BOTTOM_ALIGNMENT
-            ),
+            background: Background | None = None,
             seconds: int = constants.LOADING_SECONDS,
             dimensions: tuple[int, int] = constants.WINDOW_DIMENSIONS,
             image_path_lists: list[list[str]] = constants.LOADING_IMAGE_LISTS
@@ -52,7 +49,8 @@ class Loading:
             The basic features of the game.
         background : Background, optional
             The loading background
-            (default is Background(AnimatedText(constants.LOADING_TITLE), constants.BOTTOM_ALIGNMENT)).
+            (default is None, which creates
+            Background(AnimatedText(constants.LOADING_TITLE), constants.BOTTOM_ALIGNMENT)).
         seconds : int, optional
             The seconds of the loading screen (default is constants.LOADING_SECONDS).
         dimensions : tuple[int, int], optional
@@ -68,79 +66,77 @@ class Loading:
         FileNotFoundError
             If any image path is not found.
         """
+        if background is None:
+            background = Background(AnimatedText(constants.LOADING_TITLE), constants.BOTTOM_ALIGNMENT)
+
         self.__basic_piece = basic_piece
         self.__background = background
         self.__seconds = validation.is_positive(seconds, "'seconds' cannot be less than 1!")
         self.__dimensions = validation.is_valid_dimensions(dimensions, "All dimensions must be greater than zero!")
         self.__image_path_lists = self.__check_image_path_lists(image_path_lists)
-        self.__image_lists = self.__load_images()
-        self.__start_time = 0
+        self.__image_lists = [None] * len(self.__image_path_lists)
+        self.__deadline = 0
 
     def start(self) -> None:
         """
         Starts the loading screen.
         """
-        self.__start_time = time.time()
+        self.__deadline = time.monotonic() + self.__seconds
         self.__set_random_image_list()
         self.__loop()
 
     def __loop(self) -> None:
-        while self.__there_is_time():
-            self.__events()
-            self.__draw()
-            self.__update()
-            self.__basic_piece.clock_tick()
+        window_manager = self.__basic_piece.get_window_manager()
+        window = window_manager.get_window()
+        update_window = window_manager.update_window
+        get_events = self.__basic_piece.get_events
+        check_quit = self.__basic_piece.check_quit
+        background_events = self.__background.events
+        background_draw = self.__background.draw
+        clock_tick = self.__basic_piece.clock_tick
+        monotonic = time.monotonic
+        deadline = self.__deadline
+
+        while monotonic() < deadline:
+            for event in get_events():
+                check_quit(event)
+                background_events(event)
+            background_draw(window)
+            update_window()
+            clock_tick()
         self.__stop()
 
-    def __events(self) -> None:
-        for event in self.__basic_piece.get_events():
-            self.__basic_piece.check_quit(event)
-            self.__background.events(event)
-
-    def __draw(self) -> None:
-        self.__background.draw(self.__basic_piece.get_window_manager().get_window())
-
-    def __update(self) -> None:
-        self.__basic_piece.get_window_manager().update_window()
-
-    def __there_is_time(self) -> bool:
-        current_seconds = time.time() - self.__start_time
-        return current_seconds < self.__seconds
-
     def __stop(self) -> None:
-        self.__start_time = 0
+        self.__deadline = 0
         self.__select_next_game_state()
 
     def __select_next_game_state(self) -> None:
         last_game_state = self.__basic_piece.get_last_game_state()
 
-        if last_game_state == GameState.MENU:
+        if last_game_state is GameState.MENU:
             self.__basic_piece.set_game_state(GameState.TIMER)
-        elif last_game_state == GameState.PAUSE:
+        elif last_game_state is GameState.PAUSE:
             self.__basic_piece.set_game_state(GameState.MENU)
 
     def __set_random_image_list(self) -> None:
-        amount = len(self.__image_lists)
-        index = random.randint(0, amount - 1)
+        index = random.randrange(len(self.__image_lists))
 
-        self.__background.change_image_list(self.__image_lists[index])
+        self.__background.change_image_list(self.__get_image_list(index))
 
-    @staticmethod
-    def __check_image_path_lists(image_lists: list[list[str]]) -> list[list[str]]:
-        lists = []
-        for image_list in image_lists:
-            result = validation.check_paths(image_list, "'images_path' not found!")
-            lists.append(result)
+    def __get_image_list(self, index: int) -> list[tuple[Surface | SurfaceType, Rect | RectType]]:
+        if self.__image_lists[index] is None:
+            self.__image_lists[index] = self.__load_images(self.__image_path_lists[index])
 
-        return lists
+        return self.__image_lists[index]
 
-    def __load_images(self) -> list | list[list[tuple[Surface | SurfaceType, Rect | RectType]]]:
-        image_lists = []
-        for image_paths in self.__image_path_lists:
-            current_list = []
-            for image in util.load_images(image_paths, self.__dimensions):
-                current_list.append((image, image.get_rect()))
+    @staticmethod
+    def __check_image_path_lists(image_lists: list[list[str]]) -> list[list[str]]:
+        return [validation.check_paths(image_list, "'images_path' not found!") for image_list in image_lists]
 
-            image_lists.append(current_list)
+    def __load_images(self, image_paths: list[str]) -> list[tuple[Surface | SurfaceType, Rect | RectType]]:
+        rect = Rect((0, 0), self.__dimensions)
+        images = []
+        for image in util.load_images(image_paths, self.__dimensions):
+            images.append((image, rect))
 
-        return image_lists
+        return images
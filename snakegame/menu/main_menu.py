@@ -6,6 +6,7 @@ from snakegame.menu.sound_manager import SoundManager
 from snakegame.enuns.game_state import GameState
 from snakegame.game.basic_piece import BasicPiece
 from snakegame.menu.button import Button
+from snakegame.menu.confirmation_menu import ConfirmationMenu
 from snakegame.menu.credits_menu import CreditsMenu
 from snakegame.menu.menu import Menu
 from snakegame.menu.background import Background
@@ -38,6 +39,28 @@ class MainMenu(Menu):
         The game credits menu.
     __pause_menu : PauseMenu
         The game pause menu.
+    __actions : dict[ButtonOption, Callable[[], None]]
+        The action run for each selected option.
+    """
+
+    __slots__ = (
+        "__options_menu",
+        "__credits_menu",
+        "__pause_menu",
+        "__actions"
+    )
+
+    BUTTON_OPTIONS = (
+        ButtonOption.START,
+        ButtonOption.OPTIONS,
+        ButtonOption.CREDITS,
+        ButtonOption.QUIT
+    )
+    """The options of the menu buttons, from top to bottom.
+    """
+
+    MUSIC_FADEOUT_MILLISECONDS = 250
+    """The duration of the menu music fade when the game starts.
     """
 
     def __init__(
@@ -45,10 +68,7 @@ class MainMenu(Menu):
             basic_piece: BasicPiece,
             sound_manager: SoundManager,
             score_manager: ScoreManager,
-            background: Background=Background(
-                AnimatedFont(constants.MAIN_MENU_TITLE),
-                image_paths=constants.MAIN_MENU_IMAGES
-            ),
+            background: Background | None = None,
             button_alignment: int=constants.CENTER_ALIGNMENT
     ):
         """
@@ -63,7 +83,7 @@ class MainMenu(Menu):
         score_manager : ScoreManager
             The score manager.
         background : Background, optional
-            The main menu background (default is Background(
+            The main menu background (default is None, which creates Background(
                 AnimatedFont(constants.MAIN_MENU_TITLE),
                 image_paths=constants.MAIN_MENU_IMAGES
             )).
@@ -78,36 +98,37 @@ class MainMenu(Menu):
         ValueError
             If the 'button_alignment' value is not in the range (1-3).
         """
+        if background is None:
+            background = Background(
+                AnimatedFont(constants.MAIN_MENU_TITLE),
+                image_paths=constants.MAIN_MENU_IMAGES
+            )
+
         super().__init__(basic_piece, sound_manager, background, button_alignment)
-        self.__options_menu = OptionsMenu(basic_piece, sound_manager, score_manager)
+        confirmation_menu = ConfirmationMenu(basic_piece, sound_manager)
+        self.__options_menu = OptionsMenu(
+            basic_piece, sound_manager, score_manager, confirmation_menu=confirmation_menu
+        )
         self.__credits_menu = CreditsMenu(basic_piece, sound_manager)
-        self.__pause_menu = PauseMenu(basic_piece, sound_manager)
+        self.__pause_menu = PauseMenu(basic_piece, sound_manager, confirmation_menu=confirmation_menu)
+        self.__actions = {
+            ButtonOption.START: self.__start_game,
+            ButtonOption.OPTIONS: self.__start_options_menu,
+            ButtonOption.CREDITS: self.__start_credits_menu,
+            ButtonOption.QUIT: self.close_all
+        }
 
     def run_another_action(self, selected_option: ButtonOption) -> None:
-        if selected_option == ButtonOption.START:
-            super().get_sound_manager().stop_sound("main_menu")
-            super().get_basic_piece().set_game_state(GameState.LOADING)
-            super().quit()
-        elif selected_option == ButtonOption.OPTIONS:
-            self.__options_menu.start()
-            super().reset_selected_option()
-        elif selected_option == ButtonOption.CREDITS:
-            self.__credits_menu.start()
-            super().reset_selected_option()
-        elif selected_option == ButtonOption.QUIT:
-            super().close_all()
+        action = self.__actions.get(selected_option)
+        if action is not None:
+            action()
 
     def create_buttons(self) -> list[Button]:
-        buttons = [
-            Button(ButtonOption.START, super().get_sound_manager()),
-            Button(ButtonOption.OPTIONS, super().get_sound_manager()),
-            Button(ButtonOption.CREDITS, super().get_sound_manager()),
-            Button(ButtonOption.QUIT, super().get_sound_manager())
-        ]
-        return buttons
+        sound_manager = super().get_sound_manager()
+        return [Button(option, sound_manager) for option in MainMenu.BUTTON_OPTIONS]
 
     def other_events(self) -> None:
-        super().get_sound_manager().play_sound("main_menu", -1)
+        self.get_sound_manager().play_sound("main_menu", -1)
 
     def drawings_below(self, window: Surface) -> None:
         pass
@@ -124,3 +145,16 @@ class MainMenu(Menu):
     def start_pause_menu(self) -> None:
         """Start the pause menu."""
         self.__pause_menu.start()
+
+    def __start_game(self) -> None:
+        super().get_sound_manager().fadeout_sound("main_menu", MainMenu.MUSIC_FADEOUT_MILLISECONDS)
+        super().get_basic_piece().set_game_state(GameState.LOADING)
+        super().quit()
+
+    def __start_options_menu(self) -> None:
+        self.__options_menu.start()
+        super().reset_selected_option()
+
+    def __start_credits_menu(self) -> None:
+        self.__credits_menu.start()
+        super().reset_selected_option()
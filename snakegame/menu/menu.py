@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 
 import pygame
-from pygame import Surface
+from pygame import Surface, Rect
 from pygame.event import Event
 from pygame.key import ScancodeWrapper
 
@@ -22,6 +22,10 @@ class Menu(ABC):
     ----------
     __basic_piece : BasicPiece
         The basic features of the game.
+    __window_manager : WindowManager
+        The window manager of the game.
+    __window : Surface
+        The game window.
     __sound_manager : SoundManager
         The sound manager of the game.
     __background : Background
@@ -31,26 +35,93 @@ class Menu(ABC):
             1 - top alignment;
             2 - center alignment;
             3 - bottom alignment.
+    __layout_cache : dict[tuple, list[tuple[int, int]]]
+        The top midpoints of the buttons already computed, indexed by the
+        background position and height and by the button heights.
     __selector : AnimatedText
         The selector used to move around in the menu.
-    __buttons : list[Button]
-        The menu buttons.
+    __selector_width : int
+        The width of the selector, which never changes size.
+    __selector_centers : tuple[tuple[int, int], ...]
+        The position of the selector next to each button. Only recomputed
+        when the buttons are aligned.
+    __selector_y : int
+        The y-coordinate of the selector center, kept up to date whenever the
+        selector is moved.
+    __selector_moved : bool
+        Indicates whether the current button or its position has changed since
+        the selector was last placed next to it.
+    __buttons : tuple[Button, ...] | None
+        The menu buttons. They are only created the first time the menu is started.
+    __button_blit_sequences : tuple[Callable[[], list[tuple[Surface, Rect]]], ...]
+        The bound get_blit_sequence method of each button.
+    __button_amount : int
+        The number of menu buttons.
+    __buttons_panel : Surface
+        All the buttons composed onto a single surface.
+    __buttons_panel_rect : Rect
+        The area of the window covered by the buttons panel.
+    __buttons_panel_state : tuple[tuple[Surface, tuple[int, int, int, int]], ...]
+        The button surfaces and positions the panel was composed from.
     __current_button : int
         The index of the current button where the selector is on.
+    __selector_button : int
+        The index of the button the selector was last placed next to. Only
+        this button can be hovered or clicked.
     __selected_option : ButtonOption
         The current menu option.
     __last_selected_option : ButtonOption
         The last option that was selected in the menu.
     __is_running : bool
         Indicates whether the menu is running.
+    __needs_redraw : bool
+        Indicates whether something may have changed on screen since the last drawn frame.
     """
 
-    KEYS = {
-        "select": pygame.K_RETURN,
-        "up": pygame.K_UP,
-        "down": pygame.K_DOWN
+    __slots__ = (
+        "__basic_piece",
+        "__window_manager",
+        "__window",
+        "__sound_manager",
+        "__background",
+        "__button_alignment",
+        "__layout_cache",
+        "__buttons",
+        "__button_amount",
+        "__button_blit_sequences",
+        "__buttons_panel",
+        "__buttons_panel_rect",
+        "__buttons_panel_state",
+        "__current_button",
+        "__selector_button",
+        "__selected_option",
+        "__last_selected_option",
+        "__is_running",
+        "__needs_redraw",
+        "__selector",
+        "__selector_width",
+        "__selector_centers",
+        "__selector_y",
+        "__selector_moved"
+    )
+
+    KEY_SELECT = pygame.K_RETURN
+    """The key that selects the current button.
+    """
+
+    KEY_UP = pygame.K_UP
+    """The key that moves the selector up.
+    """
+
+    KEY_DOWN = pygame.K_DOWN
+    """The key that moves the selector down.
+    """
+
+    KEY_STEPS = {
+        KEY_UP: -1,
+        KEY_DOWN: 1
     }
-    """The menu control keys.
+    """How many buttons each directional key moves the selector.
     """
 
     SELECTOR_SYMBOL = ">"
@@ -95,16 +166,29 @@ class Menu(ABC):
             If the 'button_alignment' value is not in the range (1-3).
         """
         self.__basic_piece = basic_piece
+        self.__window_manager = basic_piece.get_window_manager()
+        self.__window = self.__window_manager.get_window()
         self.__sound_manager = sound_manager
         self.__background = background
         self.__button_alignment = self.__check_button_alignment(button_alignment)
-        self.__buttons = self.__configure_buttons()
+        self.__layout_cache = {}
+        self.__buttons = None
+        self.__button_amount = 0
+        self.__button_blit_sequences = ()
+        self.__buttons_panel = None
+        self.__buttons_panel_rect = None
+        self.__buttons_panel_state = None
         self.__current_button = 0
+        self.__selector_button = 0
         self.__selected_option = ButtonOption.NONE
         self.__last_selected_option = ButtonOption.NONE
         self.__is_running = True
+        self.__needs_redraw = True
         self.__selector = AnimatedText(Menu.SELECTOR_SYMBOL)
-        self.__update_selector_position()
+        self.__selector_width = self.__selector.get_width()
+        self.__selector_centers = ()
+        self.__selector_y = self.__selector.get_center()[1]
+        self.__selector_moved = True
 
     def start(self) -> ButtonOption:
         """
@@ -115,17 +199,33 @@ class Menu(ABC):
         last_selected_option : ButtonOption
             The last option that was selected in the menu.
         """
+        self.__load_buttons()
         self.__loop()
         return self.__last_selected_option
 
     def __loop(self) -> None:
+        events = self.__events
+        draw = self.__draw
+        update = self.__update
+        run_another_action = self.run_another_action
+        clock_tick = self.__basic_piece.clock_tick
+        none = ButtonOption.NONE
+
         while self.__is_running:
-            if self.__selected_option == ButtonOption.NONE:
-                self.__run_this()
+            selected_option = self.__selected_option
+
+            if selected_option is none:
+                events()
+
+                if self.__needs_redraw or self.__selected_option is not none:
+                    self.__needs_redraw = False
+                    draw()
+                    update()
             else:
-                self.__last_selected_option = self.__selected_option
-                self.run_another_action(self.__selected_option)
-            self.__basic_piece.clock_tick()
+                self.__last_selected_option = selected_option
+                run_another_action(selected_option)
+                self.__needs_redraw = True
+            clock_tick()
         self.__reset_state()
 
     @abstractmethod
@@ -144,6 +244,10 @@ class Menu(ABC):
         """Resets selected option to default value (default is ButtonOption.NONE)."""
         self.__selected_option = ButtonOption.NONE
 
+    def request_redraw(self) -> None:
+        """Marks the menu to be redrawn in the next frame."""
+        self.__needs_redraw = True
+
     def get_current_button_option(self) -> ButtonOption:
         """
         Get current button option.
@@ -153,23 +257,28 @@ class Menu(ABC):
         ButtonOption
             The button option.
         """
+        self.__load_buttons()
         return self.__buttons[self.__current_button].get_option()
 
     def set_background(self, background: Background) -> None:
         """
-        Change the background.
+        Change the background. Nothing is done if it is already the current background.
 
         Parameters
         ----------
         background: Background
             The new background
         """
-        last_height = self.__background.get_height()
-        self.__background = background
-        current_height = self.__background.get_height()
+        if background is not self.__background:
+            last_height = self.__background.get_height()
+            self.__background = background
+            self.__needs_redraw = True
+            current_height = self.__background.get_height()
 
-        if current_height != last_height:
-            self.__buttons = self.__align_buttons(self.__buttons)
+            if current_height != last_height and self.__buttons is not None:
+                self.__buttons = self.__align_buttons(self.__buttons)
+                self.__selector_centers = self.__calculate_selector_centers()
+                self.__selector_moved = True
 
     def get_background(self) -> Background:
         """
@@ -204,23 +313,29 @@ class Menu(ABC):
         """
         return self.__sound_manager
 
-    def __run_this(self) -> None:
-        self.__events()
-        self.__draw()
-        self.__update()
-
     def __events(self) -> None:
-        for event in self.__basic_piece.get_events():
-            self.__basic_piece.check_quit(event)
-            self.__directional_key_events(event)
-            self.__background.events(event)
-            self.__selector.animate(event)
+        events = self.__basic_piece.get_events()
+        pressed_keys = pygame.key.get_pressed()
+
+        if events:
+            self.__needs_redraw = True
+
+        for event in events:
+            event_type = event.type
+
+            if event_type == pygame.KEYDOWN:
+                self.__directional_key_events(event, pressed_keys)
+            elif event_type >= pygame.USEREVENT:
+                self.__background.events(event)
+                self.__selector.animate(event)
+            else:
+                self.__basic_piece.check_quit(event)
 
-        self.__selected_option = self.__button_events()
+        self.__selected_option = self.__button_events(pressed_keys)
         self.other_events()
 
     def __draw(self) -> None:
-        window = self.__basic_piece.get_window_manager().get_window()
+        window = self.__window
 
         self.drawings_below(window)
         self.__background.draw(window)
@@ -229,15 +344,23 @@ class Menu(ABC):
         self.drawings_above(window)
 
     def __update(self) -> None:
-        self.__basic_piece.get_window_manager().update_window()
+        self.__window_manager.update_window()
         self.__update_selector_position()
         self.other_updates()
 
-    def __configure_buttons(self) -> list[Button]:
+    def __load_buttons(self) -> None:
+        if self.__buttons is None:
+            self.__buttons = self.__configure_buttons()
+            self.__button_amount = len(self.__buttons)
+            self.__button_blit_sequences = tuple(button.get_blit_sequence for button in self.__buttons)
+            self.__selector_centers = self.__calculate_selector_centers()
+            self.__update_selector_position()
+
+    def __configure_buttons(self) -> tuple[Button, ...]:
         buttons = self.create_buttons()
-        buttons = self.__align_buttons(buttons)
+        self.__align_buttons(buttons)
 
-        return buttons
+        return tuple(buttons)
 
     @abstractmethod
     def create_buttons(self) -> list[Button]:
@@ -252,24 +375,34 @@ class Menu(ABC):
         pass
 
     def __align_buttons(self, buttons: list[Button]) -> list[Button]:
-        button_box_height_without_spaces = self.__calculate_button_box_height(buttons)
-        space_between_buttons = int(button_box_height_without_spaces * Menu.BUTTON_SPACING_PERCENTAGE) \
-                                // len(buttons)
-
-        if self.__button_alignment == 1:
-            buttons = self.__align_buttons_on_top(buttons, space_between_buttons)
-        elif self.__button_alignment == 2:
-            buttons = self.__align_buttons_on_center(buttons, space_between_buttons)
+        button_heights = tuple(button.get_height() for button in buttons)
+        layout = self.__background.get_midtop(), self.__background.get_height(), button_heights
+        midtops = self.__layout_cache.get(layout)
+
+        if midtops is None:
+            button_box_height_without_spaces = self.__calculate_button_box_height(button_heights)
+            space_between_buttons = int(button_box_height_without_spaces * Menu.BUTTON_SPACING_PERCENTAGE) \
+                                    // len(buttons)
+            button_box_height = self.__calculate_button_box_height(button_heights, space_between_buttons)
+
+            if self.__button_alignment == 1:
+                buttons = self.__align_buttons_on_top(buttons, space_between_buttons)
+            elif self.__button_alignment == 2:
+                buttons = self.__align_buttons_on_center(buttons, button_box_height, space_between_buttons)
+            else:
+                buttons = self.__align_buttons_on_bottom(buttons, button_box_height, space_between_buttons)
+
+            self.__layout_cache[layout] = [button.get_top_shape_midtop() for button in buttons]
         else:
-            buttons = self.__align_buttons_on_bottom(buttons, space_between_buttons)
+            for button, midtop in zip(buttons, midtops):
+                button.set_top_shape_midtop(midtop)
 
         return buttons
 
     @staticmethod
-    def __calculate_button_box_height(buttons: list[Button], space_between_buttons: int=0) -> int:
-        overall_spacing_between_buttons = (len(buttons) - 1) * space_between_buttons
-        button_box_height = sum([button.get_height() for button in buttons]) \
-                            + overall_spacing_between_buttons
+    def __calculate_button_box_height(button_heights: tuple[int, ...], space_between_buttons: int=0) -> int:
+        overall_spacing_between_buttons = (len(button_heights) - 1) * space_between_buttons
+        button_box_height = sum(button_heights) + overall_spacing_between_buttons
 
         return button_box_height
 
@@ -281,19 +414,25 @@ class Menu(ABC):
 
         return self.__adjust_button_alignment(buttons, initial_midtop, space_between_buttons)
 
-    def __align_buttons_on_center(self, buttons: list[Button], space_between_buttons: int) -> list[Button]:
+    def __align_buttons_on_center(
+            self,
+            buttons: list[Button],
+            button_box_height: int,
+            space_between_buttons: int
+    ) -> list[Button]:
         center_x, center_y = self.__background.get_center()
-        button_box_height = self.__calculate_button_box_height(buttons, space_between_buttons)
-
         midtop_y = center_y - button_box_height // 2
         initial_midtop = center_x, midtop_y
 
         return self.__adjust_button_alignment(buttons, initial_midtop, space_between_buttons)
 
-    def __align_buttons_on_bottom(self, buttons: list[Button], space_between_buttons: int) -> list[Button]:
+    def __align_buttons_on_bottom(
+            self,
+            buttons: list[Button],
+            button_box_height: int,
+            space_between_buttons: int
+    ) -> list[Button]:
         midbottom_x, midbottom_y = self.__background.get_midbottom()
-        button_box_height = self.__calculate_button_box_height(buttons, space_between_buttons)
-
         midtop_y = midbottom_y - button_box_height \
                        - int(self.__background.get_height() * Menu.BUTTONS_MARGIN_PERCENTAGE)
         initial_midtop = midbottom_x, midtop_y
@@ -350,55 +489,46 @@ class Menu(ABC):
         """Manage other updates in the menu."""
         pass
 
-    def __button_events(self) -> ButtonOption:
-        pressed_select = pygame.key.get_pressed()[Menu.KEYS["select"]]
-        selector_coordinate = self.__selector.get_center()
-        option = ButtonOption.NONE
-        index = 0
-
-        while option==ButtonOption.NONE and index<len(self.__buttons):
-            button = self.__buttons[index]
-            option = button.events(selector_coordinate, pressed_select)
-            index += 1
-
-        return option
+    def __button_events(self, pressed_keys: ScancodeWrapper) -> ButtonOption:
+        button = self.__buttons[self.__selector_button]
+        return button.events(self.__selector_centers[self.__selector_button], pressed_keys[Menu.KEY_SELECT])
 
     def __update_selector_position(self) -> None:
-        button = self.__buttons[self.__current_button]
+        if self.__selector_moved:
+            center = self.__selector_centers[self.__current_button]
 
-        if not button.the_selector_is_next_to_the_button(self.__selector.get_center()[1]):
-            center = self.__calculate_selector_center(button)
-            self.__selector.set_center(center)
+            # The selector swings horizontally, so only the height tells whether it has to move.
+            if self.__selector_y != center[1]:
+                self.__selector.set_center(center)
+                self.__selector_y = center[1]
+                self.__needs_redraw = True
 
-    def __calculate_selector_center(self, current_button: Button) -> tuple[int, int]:
-        x = current_button.get_bottom_shape_midleft()[0] - self.__selector.get_width()
-        y = current_button.get_bottom_shape_midleft()[1]
+            if self.__selector_button != self.__current_button:
+                self.__buttons[self.__selector_button].enable_accent_color(False)
+                self.__selector_button = self.__current_button
 
-        return x, y
+            self.__selector_moved = False
 
-    def __directional_key_events(self, event: Event) -> None:
-        if event.type == pygame.KEYDOWN:
-            pressed_keys = pygame.key.get_pressed()
-            self.__pressed_up(pressed_keys)
-            self.__pressed_down(pressed_keys)
+    def __calculate_selector_centers(self) -> tuple[tuple[int, int], ...]:
+        selector_centers = []
 
-    def __pressed_up(self, pressed_keys: ScancodeWrapper) -> None:
-        if pressed_keys[Menu.KEYS["up"]] and not pressed_keys[Menu.KEYS["select"]]:
-            if self.__current_button - 1 in range(0, len(self.__buttons)):
-                self.__current_button -= 1
-            else:
-                self.__current_button = len(self.__buttons) - 1
+        for button in self.__buttons:
+            midleft_x, midleft_y = button.get_bottom_shape_midleft()
+            selector_centers.append((midleft_x - self.__selector_width, midleft_y))
 
-            self.__sound_manager.play_sound("scroll")
+        return tuple(selector_centers)
 
-    def __pressed_down(self, pressed_keys: ScancodeWrapper) -> None:
-        if pressed_keys[Menu.KEYS["down"]] and not pressed_keys[Menu.KEYS["select"]]:
-            if self.__current_button + 1 in range(0, len(self.__buttons)):
-                self.__current_button += 1
-            else:
-                self.__current_button = 0
+    def __directional_key_events(self, event: Event, pressed_keys: ScancodeWrapper) -> None:
+        if not pressed_keys[Menu.KEY_SELECT]:
+            step = Menu.KEY_STEPS.get(event.key)
+
+            if step is not None:
+                self.__move_selector(step)
 
-            self.__sound_manager.play_sound("scroll")
+    def __move_selector(self, step: int) -> None:
+        self.__current_button = (self.__current_button + step) % self.__button_amount
+        self.__selector_moved = True
+        self.__sound_manager.play_sound("scroll")
 
     def close_all(self) -> None:
         """Closes the Pygame window and exits the program."""
@@ -410,6 +540,8 @@ class Menu(ABC):
 
     def __reset_state(self) -> None:
         self.__current_button = 0
+        self.__selector_moved = True
+        self.__needs_redraw = True
         self.__background.reset_image_loop()
         self.__selected_option = ButtonOption.NONE
         self.__is_running = True
@@ -423,8 +555,22 @@ class Menu(ABC):
         pass
 
     def __draw_buttons(self, window: Surface) -> None:
-        for button in self.__buttons:
-            button.draw(window)
+        blits = [blit for get_blit_sequence in self.__button_blit_sequences for blit in get_blit_sequence()]
+        panel_state = tuple((surface, tuple(rect)) for surface, rect in blits)
+
+        if panel_state != self.__buttons_panel_state:
+            self.__compose_buttons_panel(blits)
+            self.__buttons_panel_state = panel_state
+
+        window.blit(self.__buttons_panel, self.__buttons_panel_rect)
+
+    def __compose_buttons_panel(self, blits: list[tuple[Surface, Rect]]) -> None:
+        rect = blits[0][1].unionall([blit_rect for _, blit_rect in blits])
+        panel = Surface(rect.size, pygame.SRCALPHA)
+        panel.blits([(surface, blit_rect.move(-rect.x, -rect.y)) for surface, blit_rect in blits], doreturn=False)
+
+        self.__buttons_panel = panel
+        self.__buttons_panel_rect = rect
 
     @staticmethod
     def __check_button_alignment(button_alignment: int) -> int:
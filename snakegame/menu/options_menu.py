@@ -4,6 +4,7 @@ from snakegame import constants
 from snakegame.enuns.button_option import ButtonOption
 from snakegame.game.basic_piece import BasicPiece
 from snakegame.menu.button import Button
+from snakegame.menu.confirmation_menu import ConfirmationMenu
 from snakegame.menu.menu import Menu
 from snakegame.menu.background import Background
 from snakegame.menu.score_manager import ScoreManager
@@ -34,17 +35,24 @@ class OptionsMenu(Menu):
         The game sound menu.
     __score_menu : ScoreMenu
         The scoring menu.
+    __actions : dict[ButtonOption, Callable[[], None]]
+        The action run for each selected option.
     """
 
+    __slots__ = (
+        "__sound_menu",
+        "__score_menu",
+        "__actions"
+    )
+
     def __init__(
             self,
             basic_piece: BasicPiece,
             sound_manager: SoundManager,
             score_manager: ScoreManager,
-            background: Background = Background(
-                AnimatedText(constants.OPTIONS_MENU_TITLE)
-            ),
-            button_alignment: int = constants.CENTER_ALIGNMENT
+            background: Background | None = None,
+            button_alignment: int = constants.CENTER_ALIGNMENT,
+            confirmation_menu: ConfirmationMenu | None = None
     ):
         """
         Initialize the OptionsMenu.
@@ -58,37 +66,47 @@ class OptionsMenu(Menu):
         score_manager : ScoreManager
             The score manager.
         background : Background, optional
-            The options menu background (default is Background(AnimatedText(constants.OPTIONS_MENU_TITLE))).
+            The options menu background
+            (default is None, which creates Background(AnimatedText(constants.OPTIONS_MENU_TITLE))).
         button_alignment : {1, 2, 3}, optional
             Represents is the alignment of the buttons (default is constants.OPTIONS_MENU_BUTTON_ALIGNMENT):
                 1 - top alignment;
                 2 - center alignment;
                 3 - bottom alignment.
+        confirmation_menu : ConfirmationMenu, optional
+            The confirmation menu handed to the score menu (default is None, which
+            lets the score menu create its own).
 
         Raises
         ------
         ValueError
             If the 'button_alignment' value is not in the range (1-3).
         """
+        if background is None:
+            background = Background(AnimatedText(constants.OPTIONS_MENU_TITLE))
+
         super().__init__(basic_piece, sound_manager, background, button_alignment)
         self.__sound_menu = SoundMenu(basic_piece, sound_manager)
-        self.__score_menu = ScoreMenu(basic_piece, sound_manager, score_manager)
+        self.__score_menu = ScoreMenu(
+            basic_piece, sound_manager, score_manager, confirmation_menu=confirmation_menu
+        )
+        self.__actions = {
+            ButtonOption.SOUND: self.__start_sound_menu,
+            ButtonOption.SCORE: self.__start_score_menu,
+            ButtonOption.BACK: self.quit
+        }
 
     def run_another_action(self, selected_option: ButtonOption) -> None:
-        if selected_option == ButtonOption.SOUND:
-            self.__sound_menu.start()
-            super().reset_selected_option()
-        elif selected_option == ButtonOption.SCORE:
-            self.__score_menu.start()
-            super().reset_selected_option()
-        elif selected_option == ButtonOption.BACK:
-            super().quit()
+        action = self.__actions.get(selected_option)
+        if action is not None:
+            action()
 
     def create_buttons(self) -> list[Button]:
+        sound_manager = super().get_sound_manager()
         buttons = [
-            Button(ButtonOption.SOUND, super().get_sound_manager()),
-            Button(ButtonOption.SCORE, super().get_sound_manager()),
-            Button(ButtonOption.BACK, super().get_sound_manager())
+            Button(ButtonOption.SOUND, sound_manager),
+            Button(ButtonOption.SCORE, sound_manager),
+            Button(ButtonOption.BACK, sound_manager)
         ]
         return buttons
 
@@ -106,3 +124,11 @@ class OptionsMenu(Menu):
 
     def reset_other_states(self) -> None:
         pass
+
+    def __start_sound_menu(self) -> None:
+        self.__sound_menu.start()
+        super().reset_selected_option()
+
+    def __start_score_menu(self) -> None:
+        self.__score_menu.start()
+        super().reset_selected_option()
@@ -31,14 +31,22 @@ class PauseMenu(Menu):
             3 - bottom alignment.
     __confirmation_menu : ConfirmationMenu
         An auxiliary menu.
+    __actions : dict[ButtonOption, Callable[[], None]]
+        The action run for each selected option.
     """
 
+    __slots__ = (
+        "__confirmation_menu",
+        "__actions"
+    )
+
     def __init__(
             self,
             basic_piece: BasicPiece,
             sound_manager: SoundManager,
-            background: Background=Background(AnimatedText(constants.PAUSE_MENU_TITLE)),
-            button_alignment: int = constants.BOTTOM_ALIGNMENT
+            background: Background | None = None,
+            button_alignment: int = constants.BOTTOM_ALIGNMENT,
+            confirmation_menu: ConfirmationMenu | None = None
     ):
         """
         Initialize the PauseMenu.
@@ -50,39 +58,50 @@ class PauseMenu(Menu):
         sound_manager : SoundManager
             The sound manager of the game.
         background : Background, optional
-            The pause menu background (default is Background(AnimatedText(constants.PAUSE_MENU_TITLE))).
+            The pause menu background
+            (default is None, which creates Background(AnimatedText(constants.PAUSE_MENU_TITLE))).
         button_alignment : {1, 2, 3}, optional
             Represents is the alignment of the buttons (default is constants.PAUSE_MENU_BUTTON_ALIGNMENT):
                 1 - top alignment;
                 2 - center alignment;
                 3 - bottom alignment.
+        confirmation_menu : ConfirmationMenu, optional
+            The menu that asks the player to confirm going back to the main menu
+            (default is None, which creates ConfirmationMenu(basic_piece, sound_manager)).
 
         Raises
         ------
         ValueError
             If the 'button_alignment' value is not in the range (1-3).
         """
+        if background is None:
+            background = Background(AnimatedText(constants.PAUSE_MENU_TITLE))
+
+        if confirmation_menu is None:
+            confirmation_menu = ConfirmationMenu(basic_piece, sound_manager)
+
         super().__init__(basic_piece, sound_manager, background, button_alignment)
-        self.__confirmation_menu = ConfirmationMenu(basic_piece, sound_manager)
+        self.__confirmation_menu = confirmation_menu
+        self.__actions = {
+            ButtonOption.CONTINUE: self.__continue_game,
+            ButtonOption.BACK_TO_MAIN_MENU: self.__back_to_main_menu
+        }
 
     def run_another_action(self, selected_option: ButtonOption) -> None:
-        if selected_option == ButtonOption.CONTINUE:
-            super().get_sound_manager().stop_sound("pause_menu")
-            super().get_basic_piece().set_game_state(GameState.TIMER)
-            super().quit()
-        elif selected_option == ButtonOption.BACK_TO_MAIN_MENU:
-            option = self.__confirmation_menu.start()
-            self.__confirm_option(option)
+        action = self.__actions.get(selected_option)
+        if action is not None:
+            action()
 
     def create_buttons(self) -> list[Button]:
+        sound_manager = super().get_sound_manager()
         buttons = [
-            Button(ButtonOption.CONTINUE, super().get_sound_manager()),
-            Button(ButtonOption.BACK_TO_MAIN_MENU, super().get_sound_manager())
+            Button(ButtonOption.CONTINUE, sound_manager),
+            Button(ButtonOption.BACK_TO_MAIN_MENU, sound_manager)
         ]
         return buttons
 
     def other_events(self) -> None:
-        super().get_sound_manager().play_sound("pause_menu", -1)
+        self.get_sound_manager().play_sound("pause_menu", -1)
 
     def drawings_below(self, window: Surface) -> None:
         pass
@@ -96,8 +115,17 @@ class PauseMenu(Menu):
     def reset_other_states(self) -> None:
         pass
 
+    def __continue_game(self) -> None:
+        super().get_sound_manager().stop_sound("pause_menu")
+        super().get_basic_piece().set_game_state(GameState.TIMER)
+        super().quit()
+
+    def __back_to_main_menu(self) -> None:
+        option = self.__confirmation_menu.start()
+        self.__confirm_option(option)
+
     def __confirm_option(self, option: ButtonOption) -> None:
-        if option == ButtonOption.YES:
+        if option is ButtonOption.YES:
             super().get_sound_manager().stop_sound("pause_menu")
             super().get_basic_piece().set_game_state(GameState.LOADING)
             super().quit()
@@ -10,7 +10,7 @@ class ScoreManager:
     __score_path : str
         The path to the record file.
     __score : int
-        The record.
+        The score, kept in memory so that it is only read from the file once.
     """
 
     def __init__(
@@ -31,7 +31,7 @@ class ScoreManager:
             If the 'record_path' is not found.
         """
         self.__score_path = validation.is_valid_path(score_path, "'score path' not found!")
-        self.__score = self.get_score()
+        self.__score = self.__read_score()
 
     def set_score(self, new_score: int) -> None:
         """
@@ -44,6 +44,7 @@ class ScoreManager:
         """
         if new_score > self.__score:
             util.overwrite_txt(self.__score_path, str(new_score))
+            self.__score = new_score
 
     def get_score(self) -> int:
         """
@@ -54,9 +55,13 @@ class ScoreManager:
         score : int
             The score.
         """
-        score = util.read_txt(self.__score_path)[0]
-        return int(score)
+        return self.__score
 
     def reset_score(self) -> None:
         """Reset the score."""
         util.overwrite_txt(self.__score_path, "0")
+        self.__score = 0
+
+    def __read_score(self) -> int:
+        score = util.read_txt(self.__score_path)[0]
+        return int(score)
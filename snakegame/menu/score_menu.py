@@ -25,8 +25,10 @@ class ScoreMenu(Menu):
         The sound manager of the game.
     __score_manager : RecordManager
         The record manager.
-    __record : int
+    __record : Text
         The record.
+    __last_score : int
+        The score currently displayed by the record text.
     __background : Background
         The credits menu background.
     __button_alignment : {1, 2, 3}
@@ -36,17 +38,26 @@ class ScoreMenu(Menu):
             3 - bottom alignment.
     __confirmation_menu : ConfirmationMenu
         An auxiliary menu.
+    __actions : dict[ButtonOption, Callable[[], None]]
+        The action run for each selected option.
     """
 
+    __slots__ = (
+        "__score_manager",
+        "__record",
+        "__last_score",
+        "__confirmation_menu",
+        "__actions"
+    )
+
     def __init__(
             self,
             basic_piece: BasicPiece,
             sound_manager: SoundManager,
             score_manager: ScoreManager,
-            background: Background = Background(
-                AnimatedText(constants.SCORE_MENU_TITLE)
-            ),
-            button_alignment: int = constants.BOTTOM_ALIGNMENT
+            background: Background | None = None,
+            button_alignment: int = constants.BOTTOM_ALIGNMENT,
+            confirmation_menu: ConfirmationMenu | None = None
     ):
         """
         Initialize the ScoreMenu.
@@ -60,38 +71,49 @@ class ScoreMenu(Menu):
         score_manager : ScoreManager
             The score manager.
         background : Background, optional
-            The credits menu background (default is Background(AnimatedText(constants.CREDITS_MENU_TITLE))).
+            The score menu background
+            (default is None, which creates Background(AnimatedText(constants.SCORE_MENU_TITLE))).
         button_alignment : {1, 2, 3}, optional
             Represents is the alignment of the buttons (default is constants.CREDITS_MENU_BUTTON_ALIGNMENT):
                 1 - top alignment;
                 2 - center alignment;
                 3 - bottom alignment.
+        confirmation_menu : ConfirmationMenu, optional
+            The menu that asks the player to confirm deleting the score
+            (default is None, which creates ConfirmationMenu(basic_piece, sound_manager)).
 
         Raises
         ------
         ValueError
             If the 'button_alignment' value is not in the range (1-3).
         """
+        if background is None:
+            background = Background(AnimatedText(constants.SCORE_MENU_TITLE))
+
+        if confirmation_menu is None:
+            confirmation_menu = ConfirmationMenu(basic_piece, sound_manager)
+
         super().__init__(basic_piece, sound_manager, background, button_alignment)
-        self.__confirmation_menu = ConfirmationMenu(basic_piece, sound_manager)
+        self.__confirmation_menu = confirmation_menu
         self.__score_manager = score_manager
-        self.__record = Text(str(self.__score_manager.get_score()))
+        self.__last_score = self.__score_manager.get_score()
+        self.__record = Text(str(self.__last_score))
         self.__record = self.__align_record(self.__record)
+        self.__actions = {
+            ButtonOption.DELETE_SCORE: self.__delete_score,
+            ButtonOption.BACK: self.quit
+        }
 
     def run_another_action(self, selected_option: ButtonOption) -> None:
-        if selected_option == ButtonOption.DELETE_SCORE:
-            if self.__score_manager.get_score() > 0:
-                option = self.__confirmation_menu.start()
-                self.__confirm_option(option)
-            else:
-                super().reset_selected_option()
-        elif selected_option == ButtonOption.BACK:
-            super().quit()
+        action = self.__actions.get(selected_option)
+        if action is not None:
+            action()
 
     def create_buttons(self) -> list[Button]:
+        sound_manager = super().get_sound_manager()
         return [
-            Button(ButtonOption.DELETE_SCORE, super().get_sound_manager()),
-            Button(ButtonOption.BACK, super().get_sound_manager())
+            Button(ButtonOption.DELETE_SCORE, sound_manager),
+            Button(ButtonOption.BACK, sound_manager)
         ]
 
     def other_events(self) -> None:
@@ -104,20 +126,36 @@ class ScoreMenu(Menu):
         self.__record.draw(window)
 
     def other_updates(self) -> None:
-        self.__record.set_content(str(self.__score_manager.get_score()))
-        self.__record = self.__align_record(self.__record)
+        score = self.__score_manager.get_score()
+
+        if score != self.__last_score:
+            size = self.__record.get_rect().size
+            self.__record.set_content(str(score))
+
+            if self.__record.get_rect().size != size:
+                self.__align_record(self.__record)
+
+            self.__last_score = score
+            super().request_redraw()
 
     def reset_other_states(self) -> None:
         pass
 
+    def __delete_score(self) -> None:
+        if self.__score_manager.get_score() > 0:
+            option = self.__confirmation_menu.start()
+            self.__confirm_option(option)
+        else:
+            super().reset_selected_option()
+
     def __confirm_option(self, option: ButtonOption) -> None:
-        if option == ButtonOption.YES:
+        if option is ButtonOption.YES:
             self.__score_manager.reset_score()
 
         super().reset_selected_option()
 
     def __align_record(self, record: Text) -> Text:
-        center = super().get_background().get_center()
+        center = self.get_background().get_center()
         record.set_center(center)
 
         return record
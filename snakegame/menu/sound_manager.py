@@ -14,6 +14,8 @@ class SoundManager:
         The current volume of the game.
     __sounds : dict[str, Sound]
         The sounds of the game accompanied by their names.
+    __sounds_playing : set[str]
+        The names of the sounds playing in a loop.
     """
 
     def __init__(
@@ -52,13 +54,14 @@ class SoundManager:
         loops : int, optional
             The number of times the sound will be repeated (default is 0).
         """
-        if self.__sound_exists(name):
-            if not self.__sound_is_playing(name):
-                sound = self.__sounds.get(name.lower())
-                sound.play(loops)
+        key = name.lower()
+        sound = self.__sounds.get(key)
 
-                if loops == -1:
-                    self.__sounds_playing.add(name.lower())
+        if sound is not None and key not in self.__sounds_playing:
+            sound.play(loops)
+
+            if loops == -1:
+                self.__sounds_playing.add(key)
 
     def stop_sound(self, name: str) -> None:
         """
@@ -69,11 +72,29 @@ class SoundManager:
         name : str
             The name of the sound.
         """
-        if self.__sound_exists(name):
-            if self.__sound_is_playing(name):
-                self.__sounds_playing.remove(name.lower())
-                sound = self.__sounds.get(name.lower())
-                sound.stop()
+        key = name.lower()
+
+        if key in self.__sounds_playing:
+            self.__sounds_playing.remove(key)
+            self.__sounds[key].stop()
+
+    def fadeout_sound(self, name: str, milliseconds: int) -> None:
+        """
+        Fade out the sound and then stop it, but only if the name exists.
+        The fade happens in the mixer, so this returns immediately.
+
+        Parameters
+        ----------
+        name : str
+            The name of the sound.
+        milliseconds : int
+            The duration of the fade.
+        """
+        key = name.lower()
+
+        if key in self.__sounds_playing:
+            self.__sounds_playing.remove(key)
+            self.__sounds[key].fadeout(milliseconds)
 
     def volume_up(self) -> None:
         """Increase the volume level by 10%."""
@@ -98,20 +119,6 @@ class SoundManager:
         """
         return self.__current_volume
 
-    def __sound_exists(self, name: str) -> bool:
-        result = True
-        if self.__sounds.get(name.lower()) is None:
-            result = False
-
-        return result
-
-    def __sound_is_playing(self, name: str) -> bool:
-        result = True
-        if name.lower() not in self.__sounds_playing:
-            result = False
-
-        return result
-
     def __apply_volume(self) -> None:
         for music in self.__sounds.values():
             music.set_volume(self.__current_volume * 0.1)
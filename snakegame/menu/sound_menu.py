@@ -31,8 +31,15 @@ class SoundMenu(Menu):
             3 - bottom alignment.
     __volume_bar: VolumeBar
         The volume bar.
+    __actions : dict[ButtonOption, Callable[[], None]]
+        The action run for each selected option.
     """
 
+    __slots__ = (
+        "__volume_bar",
+        "__actions"
+    )
+
     VOLUME_BAR_MARGIN_PERCENTAGE = 0.35
     """The percentage of distance the volume bar is from the background.
     """
@@ -41,11 +48,9 @@ class SoundMenu(Menu):
             self,
             basic_piece: BasicPiece,
             sound_manager: SoundManager,
-            background: Background=Background(
-                AnimatedText(constants.SOUND_MENU_TITLE)
-            ),
+            background: Background | None = None,
             button_alignment: int=constants.BOTTOM_ALIGNMENT,
-            volume_bar=VolumeBar()
+            volume_bar: VolumeBar | None = None
     ):
         """
         Initialize the SoundMenu.
@@ -57,40 +62,47 @@ class SoundMenu(Menu):
         sound_manager : SoundManager
             The sound manager of the game.
         background : Background, optional
-            The options menu background (default is Background(AnimatedText(constants.OPTIONS_MENU_TITLE))).
+            The sound menu background
+            (default is None, which creates Background(AnimatedText(constants.SOUND_MENU_TITLE))).
         button_alignment : {1, 2, 3}, optional
             Represents is the alignment of the buttons (default is constants.OPTIONS_MENU_BUTTON_ALIGNMENT):
                 1 - top alignment;
                 2 - center alignment;
                 3 - bottom alignment.
         volume_bar: VolumeBar, optional
-            The volume bar (default is VolumeBar()).
+            The volume bar (default is None, which creates VolumeBar()).
 
         Raises
         ------
         ValueError
             If the 'button_alignment' value is not in the range (1-3).
         """
+        if background is None:
+            background = Background(AnimatedText(constants.SOUND_MENU_TITLE))
+
         super().__init__(basic_piece, sound_manager, background, button_alignment)
+
+        if volume_bar is None:
+            volume_bar = VolumeBar()
+
         self.__volume_bar = self.__align_volume_bar(volume_bar)
+        self.__actions = {
+            ButtonOption.VOLUME_UP: self.__volume_up,
+            ButtonOption.VOLUME_DOWN: self.__volume_down,
+            ButtonOption.BACK: self.quit
+        }
 
     def run_another_action(self, selected_option: ButtonOption) -> None:
-        if selected_option == ButtonOption.VOLUME_UP:
-            super().get_sound_manager().volume_up()
-            self.__volume_bar.set_volume_level(super().get_sound_manager().get_current_volume())
-            super().reset_selected_option()
-        elif selected_option == ButtonOption.VOLUME_DOWN:
-            super().get_sound_manager().volume_down()
-            self.__volume_bar.set_volume_level(super().get_sound_manager().get_current_volume())
-            super().reset_selected_option()
-        elif selected_option == ButtonOption.BACK:
-            super().quit()
+        action = self.__actions.get(selected_option)
+        if action is not None:
+            action()
 
     def create_buttons(self) -> list[Button]:
+        sound_manager = super().get_sound_manager()
         buttons = [
-            Button(ButtonOption.VOLUME_UP, super().get_sound_manager()),
-            Button(ButtonOption.VOLUME_DOWN, super().get_sound_manager()),
-            Button(ButtonOption.BACK, super().get_sound_manager())
+            Button(ButtonOption.VOLUME_UP, sound_manager),
+            Button(ButtonOption.VOLUME_DOWN, sound_manager),
+            Button(ButtonOption.BACK, sound_manager)
         ]
         return buttons
 
@@ -104,9 +116,9 @@ class SoundMenu(Menu):
         self.__volume_bar.draw(window)
 
     def __align_volume_bar(self, volume_bar: VolumeBar) -> VolumeBar:
-        x, midtop_y = super().get_background().get_midtop()
-        center = x, midtop_y + int(super().get_background().get_height()
-                                   * SoundMenu.VOLUME_BAR_MARGIN_PERCENTAGE)
+        background = super().get_background()
+        x, midtop_y = background.get_midtop()
+        center = x, midtop_y + int(background.get_height() * SoundMenu.VOLUME_BAR_MARGIN_PERCENTAGE)
         volume_bar.set_center(center)
 
         return volume_bar
@@ -116,3 +128,15 @@ class SoundMenu(Menu):
 
     def reset_other_states(self) -> None:
         pass
+
+    def __volume_up(self) -> None:
+        sound_manager = super().get_sound_manager()
+        sound_manager.volume_up()
+        self.__volume_bar.set_volume_level(sound_manager.get_current_volume())
+        super().reset_selected_option()
+
+    def __volume_down(self) -> None:
+        sound_manager = super().get_sound_manager()
+        sound_manager.volume_down()
+        self.__volume_bar.set_volume_level(sound_manager.get_current_volume())
+        super().reset_selected_option()
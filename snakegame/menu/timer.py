@@ -151,9 +151,9 @@ class Timer:
     def __select_next_game_state(self) -> None:
         last_game_state = self.__basic_piece.get_last_game_state()
 
-        if last_game_state == GameState.LOADING:
+        if last_game_state is GameState.LOADING:
             self.__basic_piece.set_game_state(GameState.GAME)
-        elif last_game_state == GameState.PAUSE:
+        elif last_game_state is GameState.PAUSE:
             self.__basic_piece.set_game_state(GameState.GAME)
 
     def __configure_number(self, font_path) -> Text:
@@ -95,18 +95,23 @@ class VolumeBar:
         window : Surface
             The window where the volume bar will be drawn.
         """
-        pygame.draw.rect(
-            window, self.__secondary_color, self.__bottom_shape,
-            border_radius=self.__border_radius
-        )
-        pygame.draw.rect(
-            window, self.__accent_color, self.__top_shape,
-            border_radius=self.__border_radius
-        )
-        pygame.draw.rect(
-            window, self.__main_color,  self.__top_shape,
-            self.__edge_thickness, self.__border_radius
-        )
+        window.lock()
+
+        try:
+            pygame.draw.rect(
+                window, self.__secondary_color, self.__bottom_shape,
+                border_radius=self.__border_radius
+            )
+            pygame.draw.rect(
+                window, self.__accent_color, self.__top_shape,
+                border_radius=self.__border_radius
+            )
+            pygame.draw.rect(
+                window, self.__main_color,  self.__top_shape,
+                self.__edge_thickness, self.__border_radius
+            )
+        finally:
+            window.unlock()
 
     def set_volume_level(self, volume: int) -> None:
         """
@@ -0,0 +1,34 @@
+from pygame.font import Font
+
+
+_FONTS: dict[tuple[str, int], Font] = {}
+"""The fonts already loaded, indexed by path and size.
+"""
+
+
+def get_font(font_path: str, size: int) -> Font:
+    """
+    Returns the font for the given path and size. The font file is only
+    loaded the first time the pair is requested; after that the same
+    Font object is reused.
+
+    Parameters
+    ----------
+    font_path : str
+        The path to the font file.
+    size : int
+        The font size.
+
+    Returns
+    -------
+    font : Font
+        The font.
+    """
+    key = (font_path, size)
+    font = _FONTS.get(key)
+
+    if font is None:
+        font = Font(font_path, size)
+        _FONTS[key] = font
+
+    return font
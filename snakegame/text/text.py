@@ -1,8 +1,8 @@
 from abc import abstractmethod
 
+import pygame.display
 import pygame.font
 from pygame.event import Event
-from pygame.font import Font
 from pygame.rect import Rect
 from pygame.rect import RectType
 from pygame.surface import Surface
@@ -10,6 +10,7 @@ from pygame.surface import SurfaceType
 
 from snakegame import validation
 from snakegame import constants
+from snakegame.text import font_cache
 
 
 class Text:
@@ -134,8 +135,9 @@ class Text:
         ValueError
             If the RGB values in the tuple are not in the range (0, 255).
         """
-        self.__color = validation.is_valid_rgb(color, "'color' out of RGB range!")
-        self.__reload_text()
+        if color != self.__color:
+            self.__color = validation.is_valid_rgb(color, "'color' out of RGB range!")
+            self.__reload_text()
 
     def get_font_path(self) -> str:
         """
@@ -329,8 +331,12 @@ class Text:
         return self.__rect.width
 
     def __configure_text(self) -> Surface | SurfaceType:
-        font = Font(self.__font_path, self.__size)
+        font = font_cache.get_font(self.__font_path, self.__size)
         text = font.render(self.__content, True, self.__color)
+
+        if pygame.display.get_surface() is not None:
+            text = text.convert_alpha()
+
         return text
 
     def __configure_rect(self) -> Rect | RectType:
@@ -4,6 +4,12 @@ from pygame import display, Surface, SurfaceType
 from snakegame import validation
 
 
+_IMAGES: dict[tuple[str, tuple[int, int], bool], Surface] = {}
+"""The images already loaded, indexed by path, dimensions and whether they were
+converted to the window pixel format.
+"""
+
+
 def get_system_display_dimensions() -> tuple[int, int]:
     """
     Returns system screen dimensions in pixels.
@@ -74,6 +80,8 @@ def load_images(image_paths: list[str], dimensions: tuple[int, int]) -> list | l
 def load_image(image_path: str, dimensions: tuple[int, int] = (-1, -1)) -> Surface:
     """
     Load an image. If the dimensions are not informed, the image is loaded in the original size.
+    Once the window exists, the image is converted to its pixel format. Each image is only
+    decoded and scaled the first time it is requested; after that the same Surface is reused.
 
     Parameters
     ----------
@@ -95,11 +103,21 @@ def load_image(image_path: str, dimensions: tuple[int, int] = (-1, -1)) -> Surfa
         If the 'image_path' is not found.
     """
     validation.is_valid_path(image_path, "'image path' not found!")
-    image = pygame.image.load(image_path)
+    converted = display.get_surface() is not None
+    key = (image_path, dimensions, converted)
+    image = _IMAGES.get(key)
+
+    if image is None:
+        image = pygame.image.load(image_path)
+
+        if dimensions != (-1, -1):
+            validation.is_valid_dimensions(dimensions, "All 'dimensions' must be greater than zero!")
+            image = pygame.transform.scale(image, dimensions)
+
+        if converted:
+            image = image.convert_alpha() if image.get_flags() & pygame.SRCALPHA else image.convert()
 
-    if dimensions != (-1, -1):
-        validation.is_valid_dimensions(dimensions, "All 'dimensions' must be greater than zero!")
-        image = pygame.transform.scale(image, dimensions)
+        _IMAGES[key] = image
 
     return image
 
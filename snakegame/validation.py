@@ -76,8 +76,12 @@ def is_valid_dimensions(dimensions: tuple[int, int], error_message: str) -> tupl
     ValueError
         If any dimension is not positive.
     """
-    is_positive(dimensions[0], "Width error. " + error_message)
-    is_positive(dimensions[1], "Height error. " + error_message)
+    width, height = dimensions
+
+    if width < 1:
+        raise ValueError("Width error. " + error_message)
+    if height < 1:
+        raise ValueError("Height error. " + error_message)
 
     return dimensions
 
@@ -103,9 +107,8 @@ def is_valid_rgb(color: tuple[int, int, int], error_message: str) -> tuple[int,
     ValueError
         If the color is invalid.
     """
-    for channel in color:
-        if channel<0 or 255<channel:
-            raise ValueError(error_message)
+    if min(color) < 0 or 255 < max(color):
+        raise ValueError(error_message)
 
     return color
 
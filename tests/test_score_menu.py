@@ -0,0 +1,100 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from pathlib import Path
+
+import pygame
+import pytest
+
+from snakegame import constants
+from snakegame.enuns.button_option import ButtonOption
+from snakegame.game.basic_piece import BasicPiece
+from snakegame.game.window_manager import WindowManager
+from snakegame.menu.menu import Menu
+from snakegame.menu.score_manager import ScoreManager
+from snakegame.menu.score_menu import ScoreMenu
+from snakegame.menu.sound_manager import SoundManager
+from snakegame.text.text import Text
+
+
+class ConfirmingMenu:
+    """Stands in for the confirmation menu and always answers yes."""
+
+    def start(self) -> ButtonOption:
+        return ButtonOption.YES
+
+
+class ScriptedClock:
+    """Drives the menu loop: holds the select key for a few frames, then waits with no input."""
+
+    def __init__(self, menu_holder: list, pressed: set, frames: int = 30):
+        self.frame = 0
+        self.frames = frames
+        self.menu_holder = menu_holder
+        self.pressed = pressed
+
+    def tick(self, fps: int) -> None:
+        self.frame += 1
+
+        if self.frame == 2:
+            self.pressed.add(Menu.KEY_SELECT)
+        elif self.frame == 4:
+            self.pressed.discard(Menu.KEY_SELECT)
+        elif self.frame >= self.frames:
+            self.menu_holder[0].quit()
+
+
+class PressedKeys:
+
+    def __init__(self, pressed: set):
+        self.pressed = pressed
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.pressed
+
+
+@pytest.fixture
+def window(monkeypatch):
+    monkeypatch.chdir(Path(__file__).resolve().parents[1])
+    pygame.init()
+    yield pygame.display.set_mode(constants.WINDOW_DIMENSIONS)
+    pygame.quit()
+
+
+def test_score_menu_redraws_after_reset_score_without_input(window, monkeypatch, tmp_path):
+    score_path = tmp_path / "score.txt"
+    score_path.write_text("7")
+
+    pressed = set()
+    monkeypatch.setattr(pygame.key, "get_pressed", lambda: PressedKeys(pressed))
+    monkeypatch.setattr(BasicPiece, "get_events", staticmethod(lambda: []))
+
+    menu_holder = []
+    clock = ScriptedClock(menu_holder, pressed)
+    basic_piece = BasicPiece(WindowManager(window), clock)
+    score_manager = ScoreManager(str(score_path))
+    menu = ScoreMenu(basic_piece, SoundManager(), score_manager, confirmation_menu=ConfirmingMenu())
+    menu_holder.append(menu)
+
+    drawn = []
+    text_draw = Text.draw
+
+    def record_draw(text: Text, surface: pygame.Surface) -> None:
+        drawn.append((clock.frame, pygame.image.tobytes(text.get_text(), "RGBA")))
+        text_draw(text, surface)
+
+    monkeypatch.setattr(Text, "draw", record_draw)
+
+    assert menu.get_current_button_option() is ButtonOption.DELETE_SCORE
+    menu.start()
+
+    zero = pygame.image.tobytes(Text("0").get_text(), "RGBA")
+    seven = pygame.image.tobytes(Text("7").get_text(), "RGBA")
+    last_frame = max(frame for frame, _ in drawn)
+    last_drawn = [image for frame, image in drawn if frame == last_frame]
+
+    assert score_manager.get_score() == 0
+    assert zero in last_drawn
+    assert seven not in last_drawn